@@ -1,64 +1,400 @@
+import asyncio
 import io
 import logging
 import os
+import re
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, Mapping
+from stat import S_ISREG
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union, Mapping, MutableMapping
 
 from google.api_core.exceptions import GoogleAPIError
 from google.auth.exceptions import GoogleAuthError
 from google.cloud import secretmanager
 from pydantic import BaseSettings
 from pydantic.env_settings import env_file_sentinel, read_env_file, SettingsError
+from pydantic.fields import ModelField
 from pydantic.utils import deep_update
 
+try:
+    from dotenv import dotenv_values
+except ImportError:
+    dotenv_values = None
+
 logger = logging.getLogger(__name__)
 
+_client: Optional[secretmanager.SecretManagerServiceClient] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> secretmanager.SecretManagerServiceClient:
+    """
+    Lazily create the Secret Manager client, shared by all callers.
+    The underlying gRPC channel is thread-safe, so no locking is needed after init
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = secretmanager.SecretManagerServiceClient()
+    return _client
+
+
+# Pinned secret versions are immutable and can be cached for long, while
+# aliases such as "latest" may move and are only cached briefly
+SECRET_CACHE_TTL = 300
+SECRET_CACHE_TTL_LATEST = 30
+SECRET_CACHE_MAXSIZE = 512
+
+_secret_cache: Dict[str, Tuple[float, bytes]] = {}
+_secret_cache_lock = threading.RLock()
+
+
+def _secret_ttl(key: str) -> float:
+    version = key.rsplit('/', 1)[-1]
+    return SECRET_CACHE_TTL if version.isdigit() else SECRET_CACHE_TTL_LATEST
+
+
+def cache_clear() -> None:
+    """
+    Drop all memoized secret payloads
+    """
+    with _secret_cache_lock:
+        _secret_cache.clear()
+
+
+def _cache_get(key: str) -> Optional[bytes]:
+    with _secret_cache_lock:
+        cached = _secret_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def _cache_set(key: str, data: bytes) -> None:
+    with _secret_cache_lock:
+        if key not in _secret_cache and len(_secret_cache) >= SECRET_CACHE_MAXSIZE:
+            # evict the oldest entry (dicts preserve insertion order)
+            del _secret_cache[next(iter(_secret_cache))]
+        _secret_cache[key] = (time.monotonic() + _secret_ttl(key), data)
+
+
+def _decode_payload(data: Optional[bytes], encoding: Optional[str] = None) -> Optional[str]:
+    if data is None:
+        return None
+    if encoding is not None:
+        return data.decode(encoding=encoding)
+    return data.decode()
+
+
+def get_google_cloud_secret_bytes(key: str) -> Optional[bytes]:
+    """
+    Fetch the raw, undecoded payload of a secret.
+    Payloads are memoized in-process; pinned versions for SECRET_CACHE_TTL seconds,
+    other aliases (e.g. "latest") for SECRET_CACHE_TTL_LATEST seconds.
+    Failed fetches are not cached.
+
+    Args:
+        key: Resource name of secret to be fetched from Secret Manager
+    """
+
+    data = _cache_get(key)
+    if data is not None:
+        return data
+
+    try:
+        client = _get_client()
+        data = client.access_secret_version(name=key).payload.data
+    except (GoogleAuthError, GoogleAPIError) as e:
+        logger.warning("Could not fetch (%s) from GCS: %s", key, e)
+        return None
+
+    _cache_set(key, data)
+    return data
+
 
 def get_google_cloud_secret(key: str, encoding=None) -> Optional[str]:
     """
+    See `get_google_cloud_secret_bytes` for caching behaviour
+
     Args:
         key: Resource name of secret to be fetched from Secret Manager
         encoding: Value for kwarg 'encoding' passed when
             decoding byte response from secret manager
     """
 
-    try:
-        client = secretmanager.SecretManagerServiceClient()
-        response = client.access_secret_version(name=key)
+    return _decode_payload(get_google_cloud_secret_bytes(key), encoding)
+
 
-        if encoding is not None:
-            return response.payload.data.decode(encoding=encoding)
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Shared worker pool for concurrent fetches, so threads are not spawned per settings build
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix='pydantic-cloud')
+    return _executor
+
+
+def _get_secret_payloads(keys: Iterable[str]) -> Dict[str, Optional[bytes]]:
+    payloads: Dict[str, Optional[bytes]] = {}
+    missing = []
+    for key in dict.fromkeys(keys):
+        data = _cache_get(key)
+        if data is None:
+            missing.append(key)
         else:
-            return response.payload.data.decode()
+            payloads[key] = data
+
+    if len(missing) == 1:
+        payloads[missing[0]] = get_google_cloud_secret_bytes(missing[0])
+    elif missing:
+        executor = _get_executor()
+        futures = {executor.submit(get_google_cloud_secret_bytes, key): key for key in missing}
+        for future in as_completed(futures):
+            payloads[futures[future]] = future.result()
+    return payloads
+
+
+def get_google_cloud_secrets(keys: Iterable[str], encoding=None) -> Dict[str, Optional[str]]:
+    """
+    Fetch several secrets at once. Duplicate resource names are fetched once,
+    cached payloads are served directly and the remaining fetches run concurrently
+    over the shared client.
+
+    Args:
+        keys: Resource names of secrets to be fetched from Secret Manager
+        encoding: See `get_google_cloud_secret`
+
+    Returns:
+        Mapping of resource name to payload (None if it could not be fetched)
+    """
+
+    return {key: _decode_payload(data, encoding) for key, data in _get_secret_payloads(keys).items()}
+
+
+# one async client per event loop, see _get_async_client
+_async_clients: MutableMapping[asyncio.AbstractEventLoop, secretmanager.SecretManagerServiceAsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+_async_clients_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    """
+    Worker threads and gRPC channels do not survive fork(), so the child drops
+    the shared executor and clients, along with locks that may have been held
+    """
+    global _client, _client_lock, _executor, _executor_lock, _async_clients, _async_clients_lock
+    global _secret_cache_lock, _cached_factory_lock
+    _client = None
+    _client_lock = threading.Lock()
+    _executor = None
+    _executor_lock = threading.Lock()
+    _async_clients = weakref.WeakKeyDictionary()
+    _async_clients_lock = threading.Lock()
+    _secret_cache_lock = threading.RLock()
+    _cached_factory_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):  # Python 3.7+
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _get_async_client() -> secretmanager.SecretManagerServiceAsyncClient:
+    """
+    Async gRPC channels are bound to the event loop they were created on,
+    so one client is kept per loop. Entries go away with their loop, and
+    clients of closed loops are dropped when a new one is created (channels
+    reference their loop, so the weak key alone would not release them).
+    Must be called from a coroutine.
+    """
+    # inside a coroutine this is the running loop (get_running_loop needs 3.7)
+    loop = asyncio.get_event_loop()
+    with _async_clients_lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            for closed_loop in [other for other in _async_clients if other.is_closed()]:
+                del _async_clients[closed_loop]
+            client = _async_clients[loop] = secretmanager.SecretManagerServiceAsyncClient()
+    return client
+
+
+async def get_google_cloud_secret_bytes_async(key: str) -> Optional[bytes]:
+    """
+    Same as `get_google_cloud_secret_bytes`, using the asyncio gRPC client.
+    Shares the in-process payload cache with the sync variant
+    """
+
+    data = _cache_get(key)
+    if data is not None:
+        return data
+
+    try:
+        client = _get_async_client()
+        data = (await client.access_secret_version(name=key)).payload.data
     except (GoogleAuthError, GoogleAPIError) as e:
         logger.warning("Could not fetch (%s) from GCS: %s", key, e)
+        return None
+
+    _cache_set(key, data)
+    return data
+
+
+async def get_google_cloud_secret_async(key: str, encoding=None) -> Optional[str]:
+    """
+    Same as `get_google_cloud_secret`, using the asyncio gRPC client
+    """
+
+    return _decode_payload(await get_google_cloud_secret_bytes_async(key), encoding)
+
+
+async def _get_secret_payloads_async(keys: Iterable[str]) -> Dict[str, Optional[bytes]]:
+    unique_keys = list(dict.fromkeys(keys))
+    results = await asyncio.gather(*(get_google_cloud_secret_bytes_async(key) for key in unique_keys))
+    return dict(zip(unique_keys, results))
+
+
+async def get_google_cloud_secrets_async(keys: Iterable[str], encoding=None) -> Dict[str, Optional[str]]:
+    """
+    Same as `get_google_cloud_secrets`, multiplexing the fetches on one event loop
+    """
+
+    payloads = await _get_secret_payloads_async(keys)
+    return {key: _decode_payload(data, encoding) for key, data in payloads.items()}
 
 
 class CloudConfig(BaseSettings.Config):
     cloud_env_file = None
     cloud_env_file_encoding = None
+    # parse the cloud env file with a plain KEY=VALUE line splitter instead of
+    # python-dotenv (handles `export` and `#` comments, but no interpolation,
+    # multiline values or escapes inside quotes)
+    cloud_env_file_simple_parser = False
+
+
+_INLINE_COMMENT = re.compile(r'\s+#.*')
+
+
+def parse_simple_env(content: str) -> Dict[str, Optional[str]]:
+    """
+    Minimal env file parser: one [export] KEY=VALUE per line. Blank lines and
+    `#` comments are skipped, quoted values are taken up to the closing quote
+    and unquoted values end at a whitespace-preceded `#`, as with python-dotenv
+    """
+    file_vars: Dict[str, Optional[str]] = {}
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        key, sep, value = line.partition('=')
+        if not sep:
+            continue
+
+        key = key.strip()
+        if key.startswith('export') and key[6:7].isspace():
+            key = key[6:].lstrip()
+
+        value = value.strip()
+        end = value.find(value[0], 1) if value[:1] in ('"', "'") else -1
+        if end != -1:
+            value = value[1:end]
+        else:
+            value = _INLINE_COMMENT.sub('', value)
+        file_vars[key] = value
+    return file_vars
 
 
 def read_cloud_env_file(
         cloud_path: str,
         encoding: str = None,
-        case_sensitive: bool = False
+        case_sensitive: bool = False,
+        simple_parser: bool = False,
 ) -> Dict[str, Optional[str]]:
-    try:
-        from dotenv import dotenv_values
-    except ImportError as e:
-        raise ImportError('python-dotenv is not installed, run `pip install pydantic[dotenv]`') from e
-
     content = get_google_cloud_secret(cloud_path, encoding=encoding)
-    stream = io.StringIO(content)
+    if not content:
+        # secret could not be fetched or is empty, nothing to parse
+        return {}
+
+    file_vars: Dict[str, Optional[str]]
+    if simple_parser:
+        file_vars = parse_simple_env(content)
+    else:
+        if dotenv_values is None:
+            raise ImportError('python-dotenv is not installed, run `pip install pydantic[dotenv]`')
+
+        # python-dotenv<0.18 only parses paths or StringIO streams, not plain strings
+        file_vars = dotenv_values(stream=io.StringIO(content), encoding=encoding or 'utf8')
 
-    file_vars: Dict[str, Optional[str]] = dotenv_values(stream=stream, encoding=encoding or 'utf8')
     if not case_sensitive:
         return {k.lower(): v for k, v in file_vars.items()}
     else:
         return file_vars
 
 
+_lower_environ: Optional[Tuple[Dict[Any, Any], Dict[str, Optional[str]]]] = None
+
+
+def _lowercase_environ() -> Dict[str, Optional[str]]:
+    """
+    Lowercased snapshot of os.environ, shared until the environment changes.
+    Staleness is checked by comparing os.environ's raw storage (a C-level dict
+    comparison) rather than decoding and lowercasing every variable again.
+    The returned dict must not be modified.
+    """
+    global _lower_environ
+    raw = getattr(os.environ, '_data', None)
+    cached = _lower_environ
+    if raw is not None and cached is not None and cached[0] == raw:
+        return cached[1]
+
+    lowered = {k.lower(): v for k, v in os.environ.items()}
+    if raw is not None:
+        _lower_environ = (dict(raw), lowered)
+    return lowered
+
+
+_env_file_cache: Dict[Tuple[str, Optional[str], bool], Tuple[int, int, Dict[str, Optional[str]]]] = {}
+
+
+def _cached_read_env_file(
+        env_path: Path, encoding: Optional[str] = None, case_sensitive: bool = False
+) -> Optional[Dict[str, Optional[str]]]:
+    """
+    `read_env_file`, re-parsing only when the file's mtime or size changed.
+    Returns None if env_path is not a file. The returned dict must not be modified.
+    """
+    try:
+        stat_result = env_path.stat()
+    except OSError:
+        return None
+    if not S_ISREG(stat_result.st_mode):
+        return None
+
+    key = (str(env_path), encoding, case_sensitive)
+    cached = _env_file_cache.get(key)
+    if cached is not None and cached[:2] == (stat_result.st_mtime_ns, stat_result.st_size):
+        return cached[2]
+
+    file_vars = read_env_file(env_path, encoding=encoding, case_sensitive=case_sensitive)
+    _env_file_cache[key] = (stat_result.st_mtime_ns, stat_result.st_size, file_vars)
+    return file_vars
+
+
+_cached_factory_lock = threading.Lock()
+
+
 class GoogleCloudSecretSettings(BaseSettings):
     """
     Fetch setting value from Google Cloud Secret Manager.
@@ -81,32 +417,111 @@ class GoogleCloudSecretSettings(BaseSettings):
 
         This will fetch the payload for secret "projects/<id>/secrets/<name>/versions/latest"
         from Google Cloud Secret Manager and use it as the value for "MY_KEY"
+
+        As with environment variables, payloads for complex fields (lists, dicts,
+        sub-models) are parsed with `Config.json_loads`. Set it to `orjson.loads`
+        to parse secret payloads straight from bytes
+
+        Every instantiation reads the environment and resolves secrets again.
+        Where the same settings are requested repeatedly (e.g. as a FastAPI
+        dependency), use the memoized instance instead:
+
+            settings = SampleSettings.cached()
     """
 
-    def _build_cloud_environ(self) -> Dict[str, Optional[str]]:
+    # Class-invariant field lookups, computed once in __init_subclass__.
+    # The fields themselves are kept, since is_complex() may change once
+    # forward refs are resolved by update_forward_refs()
+    # (alias, cloud_key, field) for fields declaring a cloud_key, key case adjusted per config
+    __cloud_fields__: Tuple[Tuple[str, str, ModelField], ...] = ()
+    # (alias, env_names, field) for every field
+    __env_field_specs__: Tuple[Tuple[str, Tuple[str, ...], ModelField], ...] = ()
+    # memoized constructor behind cached(), created per class on first use
+    __cached_factory__: Optional[Callable[..., 'GoogleCloudSecretSettings']] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        case_sensitive = cls.__config__.case_sensitive
+
+        cloud_fields = []
+        env_field_specs = []
+        for field in cls.__fields__.values():
+            extra = field.field_info.extra
+            env_field_specs.append((field.alias, tuple(extra['env_names']), field))
+
+            cloud_key = extra.get("cloud_key")
+            if isinstance(cloud_key, str):
+                cloud_fields.append((field.alias, cloud_key if case_sensitive else cloud_key.lower(), field))
+
+        cls.__cloud_fields__ = tuple(cloud_fields)
+        cls.__env_field_specs__ = tuple(env_field_specs)
+
+    @classmethod
+    def cached(cls, **values: Any) -> 'GoogleCloudSecretSettings':
+        """
+        Return a memoized instance of this settings class, built once per set of
+        (hashable) keyword arguments. Use `cached_clear()` to force a rebuild.
+        """
+        # looked up in the class' own namespace so subclasses never share a cache
+        factory = cls.__dict__.get('__cached_factory__')
+        if factory is None:
+            with _cached_factory_lock:
+                factory = cls.__dict__.get('__cached_factory__')
+                if factory is None:
+                    factory = lru_cache()(lambda **kwargs: cls(**kwargs))
+                    setattr(cls, '__cached_factory__', factory)
+        return factory(**values)
+
+    @classmethod
+    def cached_clear(cls) -> None:
+        factory = cls.__dict__.get('__cached_factory__')
+        if factory is not None:
+            factory.cache_clear()
+
+    def _json_loader(self) -> Tuple[Callable[[Any], Any], bool]:
+        """
+        Config.json_loads, and whether it accepts bytes (orjson.loads)
+        """
+        json_loads = self.__config__.json_loads
+        return json_loads, getattr(json_loads, '__module__', None) == 'orjson'
+
+    def _read_os_environ(self) -> Mapping[str, Optional[str]]:
         if self.__config__.case_sensitive:
-            env_vars: Mapping[str, Optional[str]] = os.environ
-        else:
-            env_vars = {k.lower(): v for k, v in os.environ.items()}
+            return os.environ
+        return _lowercase_environ()
 
+    def _build_cloud_environ(self, env_vars: Optional[Mapping[str, Optional[str]]] = None) -> Dict[str, Optional[str]]:
         cloud_env_file, cloud_env_file_encoding = (
             self.__config__.cloud_env_file, self.__config__.cloud_env_file_encoding
         )
-
-        if cloud_env_file is not None:
-            try:
-                env_vars = {
-                    **read_cloud_env_file(env_vars[cloud_env_file.lower()], encoding=cloud_env_file_encoding),
-                    **env_vars,
-                }
-            except KeyError:
-                logger.warning("%s not found in env", cloud_env_file)
-
+        # without a cloud env file every value here would come from os.environ,
+        # which _build_environ already provides with higher precedence
+        if cloud_env_file is None:
+            return {}
+
+        if env_vars is None:
+            env_vars = self._read_os_environ()
+
+        try:
+            env_vars = {
+                **read_cloud_env_file(
+                    env_vars[cloud_env_file.lower()],
+                    encoding=cloud_env_file_encoding,
+                    simple_parser=self.__config__.cloud_env_file_simple_parser,
+                ),
+                **env_vars,
+            }
+        except KeyError:
+            logger.warning("%s not found in env", cloud_env_file)
+            return {}
+
+        json_loads, _ = self._json_loader()
         d: Dict[str, Optional[str]] = {}
-        for field in self.__fields__.values():
+        get = env_vars.get
+        for alias, env_names, field in self.__env_field_specs__:
             env_val: Optional[str] = None
-            for env_name in field.field_info.extra['env_names']:
-                env_val = env_vars.get(env_name)
+            for env_name in env_names:
+                env_val = get(env_name)
                 if env_val is not None:
                     break
 
@@ -115,43 +530,66 @@ class GoogleCloudSecretSettings(BaseSettings):
 
             if field.is_complex():
                 try:
-                    env_val = self.__config__.json_loads(env_val)  # type: ignore
+                    env_val = json_loads(env_val)
                 except ValueError as e:
                     raise SettingsError(f'error parsing JSON for "{env_name}"') from e
-            d[field.alias] = env_val
+            d[alias] = env_val
         return d
 
     def _build_gcs_values(
-            self, _env_file: Union[Path, str, None] = None, _env_file_encoding: Optional[str] = None
-    ) -> Dict[str, Optional[str]]:
-        if self.__config__.case_sensitive:
-            env_vars: Mapping[str, Optional[str]] = os.environ
-        else:
-            env_vars = {k.lower(): v for k, v in os.environ.items()}
+            self,
+            _env_file: Union[Path, str, None] = None,
+            _env_file_encoding: Optional[str] = None,
+            env_vars: Optional[Mapping[str, Optional[str]]] = None,
+    ) -> Dict[str, Any]:
+        if not self.__cloud_fields__:
+            return {}
+
+        if env_vars is None:
+            env_vars = self._read_os_environ()
 
         env_file = _env_file if _env_file != env_file_sentinel else self.__config__.env_file
         env_file_encoding = _env_file_encoding if _env_file_encoding is not None else self.__config__.env_file_encoding
         if env_file is not None:
-            env_path = Path(env_file).expanduser()
-            if env_path.is_file():
-                env_vars = {
-                    **read_env_file(
-                        env_path, encoding=env_file_encoding, case_sensitive=self.__config__.case_sensitive
-                    ),
-                    **env_vars,
-                }
-
-        env = dict()
-        for field in self.__fields__.values():
-            cloud_key = field.field_info.extra.get("cloud_key")
-            if not isinstance(cloud_key, str):
+            file_vars = _cached_read_env_file(
+                Path(env_file).expanduser(), encoding=env_file_encoding, case_sensitive=self.__config__.case_sensitive
+            )
+            if file_vars is not None:
+                env_vars = {**file_vars, **env_vars}
+
+        tasks = []
+        for alias, cloud_key, field in self.__cloud_fields__:
+            resource_name = env_vars.get(cloud_key)
+            if not resource_name:
                 continue
 
-            cloud_key = cloud_key.lower() if not self.__config__.case_sensitive else cloud_key
-            if not env_vars.get(cloud_key):
+            tasks.append((alias, cloud_key, resource_name, field.is_complex()))
+
+        if not tasks:
+            return {}
+
+        return self._decode_gcs_values(tasks, _get_secret_payloads(name for _, _, name, _ in tasks))
+
+    def _decode_gcs_values(
+            self, tasks: List[Tuple[str, str, str, bool]], payloads: Dict[str, Optional[bytes]]
+    ) -> Dict[str, Any]:
+        """
+        tasks: (alias, cloud_key, resource name, is_complex) for each secret to decode
+        """
+        # bytes capable loaders (orjson) skip decoding the payload first
+        json_loads, loads_bytes = self._json_loader()
+
+        env: Dict[str, Any] = {}
+        for alias, cloud_key, name, is_complex in tasks:
+            data = payloads[name]
+            if data is None or not is_complex:
+                env[alias] = _decode_payload(data)
                 continue
 
-            env[field.alias] = get_google_cloud_secret(env_vars[cloud_key])
+            try:
+                env[alias] = json_loads(data if loads_bytes else data.decode())
+            except ValueError as e:
+                raise SettingsError(f'error parsing JSON for "{cloud_key}"') from e
         return env
 
     def _build_values(
@@ -161,9 +599,12 @@ class GoogleCloudSecretSettings(BaseSettings):
             _env_file_encoding: Optional[str] = None,
             _secrets_dir: Union[Path, str, None] = None,
     ) -> Dict[str, Any]:
+        env_vars = None
+        if self.__cloud_fields__ or self.__config__.cloud_env_file is not None:
+            env_vars = self._read_os_environ()
         return deep_update(
-            self._build_cloud_environ(),
-            self._build_gcs_values(_env_file, _env_file_encoding),
+            self._build_cloud_environ(env_vars),
+            self._build_gcs_values(_env_file, _env_file_encoding, env_vars),
             self._build_secrets_files(_secrets_dir),
             self._build_environ(_env_file, _env_file_encoding),
             init_kwargs
@@ -0,0 +1,36 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pydantic_cloud import gcp
+
+
+class FakeSecretClient:
+    """
+    Stand-in for SecretManagerServiceClient, serving payloads from a dict.
+    A payload that is an exception instance is raised instead.
+    """
+
+    def __init__(self):
+        self.payloads = {}
+        self.calls = []
+        self.delay = 0
+
+    def access_secret_version(self, name):
+        self.calls.append(name)
+        if self.delay:
+            time.sleep(self.delay)
+        payload = self.payloads[name]
+        if isinstance(payload, Exception):
+            raise payload
+        return SimpleNamespace(payload=SimpleNamespace(data=payload))
+
+
+@pytest.fixture
+def secret_client(monkeypatch):
+    client = FakeSecretClient()
+    monkeypatch.setattr(gcp, '_client', client)
+    gcp.cache_clear()
+    yield client
+    gcp.cache_clear()
@@ -0,0 +1,412 @@
+import asyncio
+import gc
+import io
+import os
+import signal
+import weakref
+from typing import Optional
+
+import pytest
+from google.api_core.exceptions import GoogleAPIError
+from pydantic import BaseModel, Field
+from pydantic.env_settings import SettingsError
+
+from pydantic_cloud import gcp
+
+PINNED = 'projects/p/secrets/s/versions/3'
+LATEST = 'projects/p/secrets/s/versions/latest'
+
+
+def test_secret_is_memoized(secret_client):
+    secret_client.payloads[PINNED] = b'value'
+
+    assert gcp.get_google_cloud_secret(PINNED) == 'value'
+    assert gcp.get_google_cloud_secret(PINNED) == 'value'
+    assert secret_client.calls == [PINNED]
+
+
+def test_secret_cache_expires(secret_client, monkeypatch):
+    monkeypatch.setattr(gcp, 'SECRET_CACHE_TTL', 0)
+    secret_client.payloads[PINNED] = b'old'
+    assert gcp.get_google_cloud_secret(PINNED) == 'old'
+
+    secret_client.payloads[PINNED] = b'new'
+    assert gcp.get_google_cloud_secret(PINNED) == 'new'
+    assert secret_client.calls == [PINNED, PINNED]
+
+
+def test_secret_ttl_depends_on_version():
+    assert gcp._secret_ttl(PINNED) == gcp.SECRET_CACHE_TTL
+    assert gcp._secret_ttl(LATEST) == gcp.SECRET_CACHE_TTL_LATEST
+
+
+def test_failed_fetch_is_not_cached(secret_client):
+    secret_client.payloads[LATEST] = GoogleAPIError('unavailable')
+    assert gcp.get_google_cloud_secret(LATEST) is None
+
+    secret_client.payloads[LATEST] = b'value'
+    assert gcp.get_google_cloud_secret(LATEST) == 'value'
+    assert secret_client.calls == [LATEST, LATEST]
+
+
+def test_secret_cache_evicts_oldest(secret_client, monkeypatch):
+    monkeypatch.setattr(gcp, 'SECRET_CACHE_MAXSIZE', 2)
+    for i in range(3):
+        secret_client.payloads[f'projects/p/secrets/s{i}/versions/1'] = b'x'
+        gcp.get_google_cloud_secret(f'projects/p/secrets/s{i}/versions/1')
+
+    assert list(gcp._secret_cache) == ['projects/p/secrets/s1/versions/1', 'projects/p/secrets/s2/versions/1']
+
+
+def test_cache_clear(secret_client):
+    secret_client.payloads[PINNED] = b'value'
+    gcp.get_google_cloud_secret(PINNED)
+    gcp.cache_clear()
+    gcp.get_google_cloud_secret(PINNED)
+    assert secret_client.calls == [PINNED, PINNED]
+
+
+class ForwardRefSettings(gcp.GoogleCloudSecretSettings):
+    sub: Optional['Sub'] = None
+    cloud_sub: Optional['Sub'] = Field(None, cloud_key='SUB_SECRET')
+
+    class Config:
+        cloud_env_file = 'CLOUD_ENV_FILE'
+
+
+class Sub(BaseModel):
+    x: int
+
+
+ForwardRefSettings.update_forward_refs(Sub=Sub)
+
+
+def test_forward_ref_fields_are_parsed_as_json(secret_client, monkeypatch):
+    monkeypatch.setenv('CLOUD_ENV_FILE', 'projects/p/secrets/env/versions/1')
+    monkeypatch.setenv('SUB_SECRET', PINNED)
+    secret_client.payloads['projects/p/secrets/env/versions/1'] = b'SUB={"x": 1}\n'
+    secret_client.payloads[PINNED] = b'{"x": 2}'
+
+    settings = ForwardRefSettings()
+    assert settings.sub == Sub(x=1)
+    assert settings.cloud_sub == Sub(x=2)
+
+
+@pytest.fixture
+def async_secret_client(secret_client, monkeypatch):
+    class FakeAsyncClient:
+        def __init__(self):
+            # like gRPC aio channels, hold on to the loop the client was created on
+            self.loop = asyncio.get_event_loop()
+
+        async def access_secret_version(self, name):
+            return secret_client.access_secret_version(name)
+
+    monkeypatch.setattr(gcp.secretmanager, 'SecretManagerServiceAsyncClient', FakeAsyncClient)
+    monkeypatch.setattr(gcp, '_async_clients', weakref.WeakKeyDictionary())
+    return secret_client
+
+
+def test_async_batch_fetch(async_secret_client):
+    secret_client = async_secret_client
+    secret_client.payloads[PINNED] = b'pinned'
+    secret_client.payloads[LATEST] = GoogleAPIError('unavailable')
+
+    values = asyncio.run(gcp.get_google_cloud_secrets_async([PINNED, LATEST, PINNED]))
+    assert values == {PINNED: 'pinned', LATEST: None}
+    assert sorted(secret_client.calls) == sorted([PINNED, LATEST])
+
+
+class TwoSecretSettings(gcp.GoogleCloudSecretSettings):
+    a: str = Field(None, cloud_key='SECRET_A')
+    b: str = Field(None, cloud_key='SECRET_B')
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires fork()')
+def test_concurrent_fetch_after_fork(secret_client, monkeypatch):
+    monkeypatch.setattr(gcp.secretmanager, 'SecretManagerServiceClient', lambda: secret_client)
+    monkeypatch.setenv('SECRET_A', PINNED)
+    monkeypatch.setenv('SECRET_B', LATEST)
+    secret_client.payloads[PINNED] = b'a'
+    secret_client.payloads[LATEST] = b'b'
+    # slow enough for the parent to start one worker thread per fetch
+    secret_client.delay = 0.05
+
+    assert TwoSecretSettings().b == 'b'
+    gcp.cache_clear()
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - child process
+        signal.alarm(5)
+        settings = TwoSecretSettings()
+        os._exit(0 if (settings.a, settings.b) == ('a', 'b') else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0, status
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires fork()')
+def test_cached_after_fork_with_lock_held():
+    class ForkCachedSettings(gcp.GoogleCloudSecretSettings):
+        value: str = 'x'
+
+    # as if another thread was inside cached()'s first-use block at fork time
+    with gcp._cached_factory_lock:
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - child process
+            signal.alarm(5)
+            os._exit(0 if ForkCachedSettings.cached().value == 'x' else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0, status
+
+
+def test_parse_simple_env():
+    content = '\n'.join([
+        '# comment',
+        '',
+        '  A = plain  ',
+        'B="double quoted"',
+        "C='single quoted'",
+        'D="mismatched\'',
+        'E=a=b',
+        'F=',
+        'no separator',
+        '  # indented comment',
+        'G="#not a comment"',
+        'export H=2',
+        'export  I = 3',
+        'exportJ=4',
+        'K=1 # comment',
+        'L=a#b',
+        'M="quoted" # comment',
+        "N='x'#comment",
+        'O=v\t# tab comment',
+    ])
+    assert gcp.parse_simple_env(content) == {
+        'A': 'plain',
+        'B': 'double quoted',
+        'C': 'single quoted',
+        'D': '"mismatched\'',
+        'E': 'a=b',
+        'F': '',
+        'G': '#not a comment',
+        'H': '2',
+        'I': '3',
+        'exportJ': '4',
+        'K': '1',
+        'L': 'a#b',
+        'M': 'quoted',
+        'N': 'x',
+        'O': 'v',
+    }
+
+
+def test_parse_simple_env_matches_dotenv():
+    dotenv = pytest.importorskip('dotenv')
+    content = '\n'.join([
+        '# comment',
+        'export A=1',
+        'B = spaced  ',
+        'C=1 # comment',
+        'D=a#b',
+        'E="quoted" # comment',
+        "F='single'",
+        'G=a=b',
+        'H=',
+    ])
+    assert gcp.parse_simple_env(content) == dict(dotenv.dotenv_values(stream=io.StringIO(content)))
+
+
+def test_read_cloud_env_file_simple_parser(secret_client):
+    secret_client.payloads[PINNED] = b'KEY="value"\nOther=1\n'
+
+    assert gcp.read_cloud_env_file(PINNED, simple_parser=True) == {'key': 'value', 'other': '1'}
+    assert gcp.read_cloud_env_file(PINNED, case_sensitive=True, simple_parser=True) == {'KEY': 'value', 'Other': '1'}
+
+
+def test_read_cloud_env_file_missing_secret(secret_client):
+    secret_client.payloads[PINNED] = GoogleAPIError('unavailable')
+    assert gcp.read_cloud_env_file(PINNED) == {}
+
+
+class MultiEnvSettings(gcp.GoogleCloudSecretSettings):
+    value: str = Field(None, env=['FIRST', 'SECOND', 'THIRD'])
+
+    class Config:
+        cloud_env_file = 'CLOUD_ENV_FILE'
+
+
+def test_cloud_environ_first_env_name_wins(secret_client):
+    secret_client.payloads[PINNED] = b'THIRD=from file\n'
+    settings = MultiEnvSettings.construct()
+
+    def build(**env_vars):
+        gcp.cache_clear()
+        return settings._build_cloud_environ({'cloud_env_file': PINNED, **env_vars})
+
+    assert build() == {'value': 'from file'}
+    assert build(second='2', third='3') == {'value': '2'}
+    assert build(first='1', second='2') == {'value': '1'}
+    # an empty value still counts as set
+    assert build(first='', second='2') == {'value': ''}
+
+
+def test_cached_instances(secret_client):
+    class Parent(gcp.GoogleCloudSecretSettings):
+        value: str = 'parent'
+
+    class Child(Parent):
+        pass
+
+    assert gcp.GoogleCloudSecretSettings.cached() is gcp.GoogleCloudSecretSettings.cached()
+    assert Parent.cached() is Parent.cached()
+    assert Child.cached() is not Parent.cached()
+    assert type(Child.cached()) is Child
+    assert Parent.cached(value='other').value == 'other'
+
+    first = Parent.cached()
+    Parent.cached_clear()
+    assert Parent.cached() is not first
+    Child.cached_clear()
+    gcp.GoogleCloudSecretSettings.cached_clear()
+
+
+class JsonSettings(gcp.GoogleCloudSecretSettings):
+    data: dict = Field(None, cloud_key='JSON_SECRET')
+    values: list = Field(None, cloud_key='LIST_SECRET')
+
+
+def test_default_json_loads_is_stdlib(secret_client, monkeypatch):
+    monkeypatch.setenv('JSON_SECRET', PINNED)
+    monkeypatch.setenv('LIST_SECRET', LATEST)
+    secret_client.payloads[PINNED] = b'{"v": 123456789012345678901234567890}'
+    secret_client.payloads[LATEST] = b'[NaN]'
+
+    settings = JsonSettings()
+    assert settings.data == {'v': 123456789012345678901234567890}
+    assert settings.values[0] != settings.values[0]
+
+
+def test_invalid_json_error_names_cloud_key(secret_client, monkeypatch):
+    monkeypatch.setenv('JSON_SECRET', PINNED)
+    secret_client.payloads[PINNED] = b'not json'
+
+    with pytest.raises(SettingsError, match='error parsing JSON for "json_secret"'):
+        JsonSettings()
+
+
+def test_orjson_loads_receives_bytes(secret_client, monkeypatch):
+    orjson = pytest.importorskip('orjson')
+    received = []
+
+    def loads(value):
+        received.append(value)
+        return orjson.loads(value)
+
+    # keep orjson's module name so the bytes fast path is detected
+    loads.__module__ = 'orjson'
+
+    class OrjsonSettings(JsonSettings):
+        class Config:
+            json_loads = loads
+
+    monkeypatch.setenv('JSON_SECRET', PINNED)
+    secret_client.payloads[PINNED] = b'{"v": 1}'
+
+    assert OrjsonSettings().data == {'v': 1}
+    assert received == [b'{"v": 1}']
+
+
+def test_env_file_cache(tmp_path, monkeypatch):
+    env_path = tmp_path / '.env'
+    env_path.write_text('A=1\n')
+    parsed = []
+    read_env_file = gcp.read_env_file
+
+    def counting_read_env_file(*args, **kwargs):
+        parsed.append(args[0])
+        return read_env_file(*args, **kwargs)
+
+    monkeypatch.setattr(gcp, 'read_env_file', counting_read_env_file)
+    monkeypatch.setattr(gcp, '_env_file_cache', {})
+
+    assert gcp._cached_read_env_file(env_path) == {'a': '1'}
+    assert gcp._cached_read_env_file(env_path) == {'a': '1'}
+    assert len(parsed) == 1
+
+    # a different case_sensitive setting is cached separately
+    assert gcp._cached_read_env_file(env_path, case_sensitive=True) == {'A': '1'}
+    assert len(parsed) == 2
+
+    env_path.write_text('A=22\n')
+    assert gcp._cached_read_env_file(env_path) == {'a': '22'}
+
+    # same size, new mtime
+    env_path.write_text('A=33\n')
+    stat_result = env_path.stat()
+    os.utime(env_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+    assert gcp._cached_read_env_file(env_path) == {'a': '33'}
+    assert len(parsed) == 4
+
+
+def test_env_file_cache_missing_or_not_a_file(tmp_path):
+    assert gcp._cached_read_env_file(tmp_path / 'missing.env') is None
+    assert gcp._cached_read_env_file(tmp_path) is None
+
+
+def test_async_clients_do_not_pile_up(async_secret_client):
+    async_secret_client.payloads[PINNED] = b'pinned'
+
+    async def fetch():
+        gcp.cache_clear()
+        await gcp.get_google_cloud_secret_async(PINNED)
+        return gcp._get_async_client()
+
+    async def same_loop():
+        return gcp._get_async_client() is gcp._get_async_client()
+
+    first = weakref.ref(asyncio.run(fetch()))
+    second = asyncio.run(fetch())
+    gc.collect()
+
+    assert first() is None
+    assert list(gcp._async_clients.values()) == [second]
+    assert asyncio.run(same_loop())
+
+
+def test_lowercase_environ_tracks_changes(secret_client, monkeypatch):
+    monkeypatch.setattr(gcp, '_lower_environ', None)
+    secret_client.payloads[PINNED] = b'pinned'
+    secret_client.payloads[LATEST] = b'latest'
+    monkeypatch.setenv('SECRET_A', PINNED)
+    monkeypatch.delenv('SECRET_B', raising=False)
+
+    assert TwoSecretSettings().a == 'pinned'
+    assert gcp._lowercase_environ() is gcp._lowercase_environ()
+
+    monkeypatch.setenv('SECRET_A', LATEST)
+    assert TwoSecretSettings().a == 'latest'
+
+    monkeypatch.setenv('SECRET_B', PINNED)
+    assert TwoSecretSettings().b == 'pinned'
+
+    monkeypatch.delenv('SECRET_A')
+    assert TwoSecretSettings().a is None
+
+
+def test_lowercase_environ_without_raw_data(secret_client, monkeypatch):
+    monkeypatch.setattr(gcp, '_lower_environ', None)
+    # a plain mapping, as on platforms whose os.environ has no _data
+    environ = {'SECRET_A': PINNED}
+    monkeypatch.setattr(os, 'environ', environ)
+    secret_client.payloads[PINNED] = b'pinned'
+    secret_client.payloads[LATEST] = b'latest'
+
+    assert gcp._lowercase_environ() == {'secret_a': PINNED}
+    assert gcp._lowercase_environ() is not gcp._lowercase_environ()
+    assert gcp._lower_environ is None
+
+    assert TwoSecretSettings().a == 'pinned'
+    environ['SECRET_A'] = LATEST
+    assert TwoSecretSettings().a == 'latest'